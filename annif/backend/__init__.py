@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Type
 
 if TYPE_CHECKING:
@@ -115,6 +116,7 @@ _backend_fns = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_backend(backend_id: str) -> Type[AnnifBackend]:
     if backend_id in _backend_fns:
         return _backend_fns[backend_id]()
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import abc
-import os.path
+import os
 from datetime import datetime, timezone
-from glob import glob
+from fnmatch import fnmatch
 from typing import TYPE_CHECKING, Any
 
 from annif import logger
 from annif.suggestion import SuggestionBatch
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from configparser import SectionProxy
 
     from annif.corpus.document import DocumentCorpus
@@ -26,6 +27,8 @@ class AnnifBackend(metaclass=abc.ABCMeta):
 
     DEFAULT_PARAMETERS = {"limit": 100}
 
+    MODEL_IGNORE_PATTERNS = ("*-train*", "tmp-*", "vectorizer")
+
     def __init__(
         self,
         backend_id: str,
@@ -52,27 +55,40 @@ class AnnifBackend(metaclass=abc.ABCMeta):
         params.update(self.config_params)
         return params
 
+    def _scan_model_files(self, path: str | None = None) -> Iterator[os.DirEntry]:
+        """Walk the data directory in a single pass using os.scandir, yielding
+        the entries of model files. Training data and temporary files at the
+        top level of the data directory are skipped."""
+        toplevel = path is None
+        try:
+            with os.scandir(self.datadir if toplevel else path) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue  # hidden files are skipped, like glob does
+            if entry.is_dir():
+                yield from self._scan_model_files(entry.path)
+            elif entry.is_file() and not (
+                toplevel
+                and any(fnmatch(entry.name, igp) for igp in self.MODEL_IGNORE_PATTERNS)
+            ):
+                yield entry
+
     @property
     def _model_file_paths(self) -> list:
-        all_paths = glob(os.path.join(self.datadir, "**"), recursive=True)
-        file_paths = [p for p in all_paths if os.path.isfile(p)]
-        ignore_patterns = ("*-train*", "tmp-*", "vectorizer")
-        ignore_paths = [
-            path
-            for igp in ignore_patterns
-            for path in glob(os.path.join(self.datadir, igp))
-        ]
-        return list(set(file_paths) - set(ignore_paths))
+        return [entry.path for entry in self._scan_model_files()]
 
     @property
     def is_trained(self) -> bool:
-        return bool(self._model_file_paths)
+        return any(True for _ in self._scan_model_files())
 
     @property
     def modification_time(self) -> datetime | None:
         mtimes = [
-            datetime.utcfromtimestamp(os.path.getmtime(p))
-            for p in self._model_file_paths
+            datetime.utcfromtimestamp(entry.stat().st_mtime)
+            for entry in self._scan_model_files()
         ]
         most_recent = max(mtimes, default=None)
         if most_recent is None:
@@ -127,10 +143,16 @@ class AnnifBackend(metaclass=abc.ABCMeta):
         """This method can be implemented by backends to use batching of documents in
         their operations. This default implementation uses the regular suggest
         functionality."""
+        limit = int(params.get("limit"))
+        if limit <= 0:
+            # no suggestions would be kept, so don't bother computing them
+            return SuggestionBatch.from_sequence(
+                [[] for _ in texts], self.project.subjects
+            )
         return SuggestionBatch.from_sequence(
             [self._suggest(text, params) for text in texts],
             self.project.subjects,
-            limit=int(params.get("limit")),
+            limit=limit,
         )
 
     def suggest(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import multiprocessing.dummy
 from typing import TYPE_CHECKING, Any
 
 import annif.eval
@@ -25,6 +26,14 @@ if TYPE_CHECKING:
 class BaseEnsembleBackend(backend.AnnifBackend):
     """Base class for ensemble backends"""
 
+    DEFAULT_PARAMETERS = {"parallel_sources": False}
+
+    def default_params(self) -> dict[str, Any]:
+        params = backend.AnnifBackend.DEFAULT_PARAMETERS.copy()
+        params.update(BaseEnsembleBackend.DEFAULT_PARAMETERS)
+        params.update(self.DEFAULT_PARAMETERS)
+        return params
+
     def _get_sources_attribute(self, attr: str) -> list[bool | None]:
         params = self._get_backend_params(None)
         sources = annif.util.parse_sources(params["sources"])
@@ -41,12 +50,22 @@ class BaseEnsembleBackend(backend.AnnifBackend):
             project.initialize(parallel)
 
     def _suggest_with_sources(
-        self, texts: list[str], sources: list[tuple[str, float]]
+        self,
+        texts: list[str],
+        sources: list[tuple[str, float]],
+        parallel: bool = False,
     ) -> dict[str, SuggestionBatch]:
-        return {
-            project_id: self.project.registry.get_project(project_id).suggest(texts)
-            for project_id, _ in sources
-        }
+        projects = [
+            self.project.registry.get_project(project_id) for project_id, _ in sources
+        ]
+        if parallel and len(projects) > 1:
+            # query the sources concurrently using threads, so that slow
+            # (e.g. remote) sources don't have to wait for each other
+            with multiprocessing.dummy.Pool(len(projects)) as pool:
+                batches = pool.map(lambda project: project.suggest(texts), projects)
+        else:
+            batches = [project.suggest(texts) for project in projects]
+        return {project_id: batch for (project_id, _), batch in zip(sources, batches)}
 
     def _merge_source_batches(
         self,
@@ -69,7 +88,9 @@ class BaseEnsembleBackend(backend.AnnifBackend):
         self, texts: list[str], params: dict[str, Any]
     ) -> SuggestionBatch:
         sources = annif.util.parse_sources(params["sources"])
-        batch_by_source = self._suggest_with_sources(texts, sources)
+        batch_by_source = self._suggest_with_sources(
+            texts, sources, annif.util.boolean(params["parallel_sources"])
+        )
         return self._merge_source_batches(batch_by_source, sources, params)
 
 
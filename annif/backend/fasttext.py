@@ -89,7 +89,7 @@ class FastTextBackend(mixins.ChunkingBackend, backend.AnnifBackend):
 
     @staticmethod
     def _id_to_label(subject_id: int) -> str:
-        return "__label__{:d}".format(subject_id)
+        return f"__label__{subject_id:d}"
 
     def _label_to_subject_id(self, label: str) -> int:
         labelnum = label.replace("__label__", "")
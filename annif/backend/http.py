@@ -4,14 +4,20 @@ and returns the results"""
 from __future__ import annotations
 
 import importlib
+import multiprocessing.dummy
+import os
+import threading
 from typing import TYPE_CHECKING, Any
 
 import dateutil.parser
 import requests
 import requests.exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+import annif.util
 from annif.exception import OperationFailedException
-from annif.suggestion import SubjectSuggestion
+from annif.suggestion import SubjectSuggestion, SuggestionBatch
 
 from . import backend
 
@@ -22,6 +28,26 @@ if TYPE_CHECKING:
 class HTTPBackend(backend.AnnifBackend):
     name = "http"
     _headers = None
+    _session = None
+    _session_pid = None
+    _session_pool_size = 0
+    _session_lock = threading.Lock()
+
+    # concurrency > 1 sends that many requests in parallel; this is opt-in
+    # so that remote services only get one request at a time by default
+    DEFAULT_PARAMETERS = {"concurrency": 1, "batch_endpoint": False}
+
+    # maximum number of documents per request to the suggest-batch endpoint
+    BATCH_MAX_DOCUMENTS = 32
+
+    # retry transient failures; suggest requests are safe to repeat
+    RETRY = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "POST"),
+        raise_on_status=False,
+    )
 
     @property
     def headers(self) -> dict[str, str]:
@@ -32,6 +58,33 @@ class HTTPBackend(backend.AnnifBackend):
             }
         return self._headers
 
+    def _get_session(self, pool_size: int) -> requests.Session:
+        """Return the session of this process, making sure that its
+        connection pool can hold at least pool_size connections."""
+
+        with self._session_lock:
+            # The session keeps connections alive between requests. Pooled
+            # connections must not be shared with forked worker processes, so
+            # each process creates its own session.
+            if self._session is None or self._session_pid != os.getpid():
+                self._session = requests.Session()
+                self._session_pid = os.getpid()
+                self._session_pool_size = 0
+            if pool_size > self._session_pool_size:
+                # replace the adapter with a larger one; connections in use
+                # by the old adapter are released when it is garbage collected
+                adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=self.RETRY)
+                self._session.mount("http://", adapter)
+                self._session.mount("https://", adapter)
+                self._session_pool_size = pool_size
+            return self._session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is not None and self._session_pid == os.getpid():
+            return self._session
+        return self._get_session(max(int(self.params["concurrency"]), 1))
+
     @property
     def is_trained(self) -> bool | None:
         return self._get_project_info("is_trained")
@@ -46,7 +99,7 @@ class HTTPBackend(backend.AnnifBackend):
     def _get_project_info(self, key: str) -> bool | str | None:
         params = self._get_backend_params(None)
         try:
-            req = requests.get(
+            req = self.session.get(
                 params["endpoint"].replace("/suggest", ""), headers=self.headers
             )
             req.raise_for_status()
@@ -72,7 +125,7 @@ class HTTPBackend(backend.AnnifBackend):
             data["limit"] = params["limit"]
 
         try:
-            req = requests.post(params["endpoint"], data=data, headers=self.headers)
+            req = self.session.post(params["endpoint"], data=data, headers=self.headers)
             req.raise_for_status()
         except requests.exceptions.RequestException as err:
             self.warning("HTTP request failed: {}".format(err))
@@ -89,6 +142,9 @@ class HTTPBackend(backend.AnnifBackend):
         else:
             results = response
 
+        return self._hits_to_suggestions(results)
+
+    def _hits_to_suggestions(self, results: list[dict]) -> list[SubjectSuggestion]:
         try:
             subject_suggestions = [
                 SubjectSuggestion(
@@ -103,3 +159,75 @@ class HTTPBackend(backend.AnnifBackend):
             return []
 
         return subject_suggestions
+
+    def _suggest_with_batch_endpoint(
+        self, texts: list[str], params: dict[str, Any]
+    ) -> list[list[SubjectSuggestion]]:
+        """Suggest subjects for the texts using the suggest-batch method of the
+        Annif REST API, sending up to BATCH_MAX_DOCUMENTS texts per request"""
+        endpoint = params["endpoint"] + "-batch"
+        query = {"limit": params["limit"]} if "limit" in params else {}
+        suggestions = []
+        for idx in range(0, len(texts), self.BATCH_MAX_DOCUMENTS):
+            documents = [
+                {"text": text} for text in texts[idx : idx + self.BATCH_MAX_DOCUMENTS]
+            ]
+            try:
+                req = self.session.post(
+                    endpoint,
+                    json={"documents": documents},
+                    params=query,
+                    headers=self.headers,
+                )
+                req.raise_for_status()
+            except requests.exceptions.RequestException as err:
+                self.warning("HTTP request failed: {}".format(err))
+                suggestions.extend([] for _ in documents)
+                continue
+
+            try:
+                response = req.json()
+            except ValueError as err:
+                self.warning("JSON decode failed: {}".format(err))
+                suggestions.extend([] for _ in documents)
+                continue
+
+            if not isinstance(response, list) or len(response) != len(documents):
+                self.warning("Unexpected response from suggest-batch endpoint")
+                suggestions.extend([] for _ in documents)
+                continue
+
+            for doc_results in response:
+                if isinstance(doc_results, dict):
+                    results = doc_results.get("results", [])
+                else:
+                    results = []
+                suggestions.append(self._hits_to_suggestions(results))
+        return suggestions
+
+    def _suggest_batch(
+        self, texts: list[str], params: dict[str, Any]
+    ) -> SuggestionBatch:
+        limit = int(params.get("limit"))
+        if limit <= 0:
+            # no suggestions would be kept, so don't send any requests
+            return SuggestionBatch.from_sequence(
+                [[] for _ in texts], self.project.subjects
+            )
+        concurrency = min(int(params["concurrency"]), len(texts))
+        if annif.util.boolean(params["batch_endpoint"]):
+            results = self._suggest_with_batch_endpoint(texts, params)
+        elif concurrency <= 1:
+            return super()._suggest_batch(texts, params)
+        else:
+            # set up the session in this thread, with room for a connection
+            # per worker, before the workers start using it
+            self._get_session(concurrency)
+            # the requests are I/O bound, so send them concurrently using threads
+            with multiprocessing.dummy.Pool(concurrency) as pool:
+                results = pool.map(lambda text: self._suggest(text, params), texts)
+        return SuggestionBatch.from_sequence(
+            results,
+            self.project.subjects,
+            limit=limit,
+        )
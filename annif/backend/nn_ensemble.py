@@ -29,7 +29,7 @@ from annif.exception import (
     NotSupportedException,
     OperationFailedException,
 )
-from annif.suggestion import SuggestionBatch, vector_to_suggestions
+from annif.suggestion import SuggestionBatch
 
 from . import backend, ensemble
 
@@ -124,9 +124,9 @@ class NNEnsembleBackend(backend.AnnifLearningBackend, ensemble.BaseEnsembleBacke
     _model = None
 
     def initialize(self, parallel: bool = False) -> None:
-        super().initialize(parallel)
         if self._model is not None:
-            return  # already initialized
+            return  # already initialized, including the source projects
+        super().initialize(parallel)
         if parallel:
             # Don't load TF model just before parallel execution,
             # since it won't work after forking worker processes
@@ -162,23 +162,16 @@ class NNEnsembleBackend(backend.AnnifLearningBackend, ensemble.BaseEnsembleBacke
         src_weight = dict(sources)
         score_vectors = np.array(
             [
-                [
-                    np.sqrt(suggestions.as_vector())
-                    * src_weight[project_id]
-                    * len(batch_by_source)
-                    for suggestions in batch
-                ]
+                np.sqrt(batch.array.toarray())
+                * src_weight[project_id]
+                * len(batch_by_source)
                 for project_id, batch in batch_by_source.items()
             ],
             dtype=np.float32,
         ).transpose(1, 2, 0)
         prediction = self._model(score_vectors).numpy()
-        return SuggestionBatch.from_sequence(
-            [
-                vector_to_suggestions(row, limit=int(params["limit"]))
-                for row in prediction
-            ],
-            self.project.subjects,
+        return SuggestionBatch.from_dense(
+            prediction, self.project.subjects, limit=int(params["limit"])
         )
 
     def _create_model(self, sources: list[tuple[str, float]]) -> None:
@@ -255,18 +248,21 @@ class NNEnsembleBackend(backend.AnnifLearningBackend, ensemble.BaseEnsembleBacke
 
         self.info("Processing training documents...")
         with pool_class(jobs) as pool:
-            for hits, subject_set in pool.imap_unordered(
-                psmap.suggest, corpus.documents
+            for hit_sets, subject_sets in pool.imap_unordered(
+                psmap.suggest_batch, corpus.doc_batches
             ):
-                doc_scores = []
-                for project_id, p_hits in hits.items():
-                    vector = p_hits.as_vector()
-                    doc_scores.append(
-                        np.sqrt(vector) * sources[project_id] * len(sources)
-                    )
-                score_vector = np.array(doc_scores, dtype=np.float32).transpose()
-                true_vector = subject_set.as_vector(len(self.project.subjects))
-                seq.add_sample(score_vector, true_vector)
+                score_vectors = np.array(
+                    [
+                        np.sqrt(hit_sets[project_id].array.toarray())
+                        * weight
+                        * len(sources)
+                        for project_id, weight in sources.items()
+                    ],
+                    dtype=np.float32,
+                ).transpose(1, 2, 0)
+                for score_vector, subject_set in zip(score_vectors, subject_sets):
+                    true_vector = subject_set.as_vector(len(self.project.subjects))
+                    seq.add_sample(score_vector, true_vector)
 
     def _open_lmdb(self, cached, lmdb_map_size):
         lmdb_path = os.path.join(self.datadir, self.LMDB_FILE)
@@ -80,9 +80,11 @@ class OmikujiBackend(mixins.TfidfVectorizerMixin, backend.AnnifBackend):
             n_samples = 0
             for doc, vector in zip(corpus.documents, veccorpus):
                 subject_ids = [str(subject_id) for subject_id in doc.subject_set]
+                # read the features directly from the CSR row arrays
                 feature_values = [
-                    "{}:{}".format(col, vector[row, col])
-                    for row, col in zip(*vector.nonzero())
+                    f"{col}:{val}"
+                    for col, val in zip(vector.indices.tolist(), vector.data.tolist())
+                    if val != 0
                 ]
                 if not subject_ids or not feature_values:
                     continue  # noqa
@@ -141,7 +143,7 @@ class OmikujiBackend(mixins.TfidfVectorizerMixin, backend.AnnifBackend):
             if row.nnz == 0:  # All zero vector, empty result
                 batch_results.append([])
                 continue
-            feature_values = [(col, row[0, col]) for col in row.nonzero()[1]]
+            feature_values = list(zip(row.indices.tolist(), row.data.tolist()))
             results = []
             for subj_id, score in self._model.predict(feature_values, top_k=limit):
                 results.append(SubjectSuggestion(subject_id=subj_id, score=score))
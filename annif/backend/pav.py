@@ -38,9 +38,9 @@ class PAVBackend(ensemble.BaseEnsembleBackend):
     DEFAULT_PARAMETERS = {"min-docs": 10}
 
     def initialize(self, parallel: bool = False) -> None:
-        super().initialize(parallel)
         if self._models is not None:
-            return  # already initialized
+            return  # already initialized, including the source projects
+        super().initialize(parallel)
         self._models = {}
         sources = annif.util.parse_sources(self.params["sources"])
         for source_project_id, _ in sources:
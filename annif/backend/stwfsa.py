@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 from stwfsapy.predictor import StwfsapyPredictor
 
 from annif.exception import NotInitializedException, NotSupportedException
-from annif.suggestion import SubjectSuggestion
+from annif.suggestion import SubjectSuggestion, SuggestionBatch
 from annif.util import atomic_save, boolean
 
 from . import backend
@@ -125,14 +125,22 @@ class StwfsaBackend(backend.AnnifBackend):
             lambda model, store_path: model.store(store_path),
         )
 
-    def _suggest(self, text: str, params: dict[str, Any]) -> list[SubjectSuggestion]:
-        self.debug(f'Suggesting subjects for text "{text[:20]}..." (len={len(text)})')
-        result = self._model.suggest_proba([text])[0]
-        suggestions = []
-        for uri, score in result:
-            subject_id = self.project.subjects.by_uri(uri)
-            if subject_id is not None:
-                suggestions.append(
-                    SubjectSuggestion(subject_id=subject_id, score=score)
-                )
-        return suggestions
+    def _suggest_batch(
+        self, texts: list[str], params: dict[str, Any]
+    ) -> SuggestionBatch:
+        self.debug(f"Suggesting subjects for batch of {len(texts)} texts")
+        # the predictor matches and classifies the whole batch in one call
+        results = self._model.suggest_proba(texts)
+        batch_suggestions = []
+        for result in results:
+            suggestions = []
+            for uri, score in result:
+                subject_id = self.project.subjects.by_uri(uri)
+                if subject_id is not None:
+                    suggestions.append(
+                        SubjectSuggestion(subject_id=subject_id, score=score)
+                    )
+            batch_suggestions.append(suggestions)
+        return SuggestionBatch.from_sequence(
+            batch_suggestions, self.project.subjects, limit=int(params.get("limit"))
+        )
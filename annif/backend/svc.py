@@ -96,13 +96,17 @@ class SVCBackend(mixins.TfidfVectorizerMixin, backend.AnnifBackend):
         self, scores: np.ndarray, params: dict[str, Any]
     ) -> list[SubjectSuggestion]:
         results = []
-        limit = int(params["limit"])
-        for class_id in np.argsort(scores)[::-1][:limit]:
-            subject_id = self._model.classes_[class_id]
+        limit = min(int(params["limit"]), len(scores))
+        if limit <= 0:
+            return results
+        # select the top K classes without sorting all of them
+        top_k = np.argpartition(scores, -limit)[-limit:]
+        top_k = top_k[np.argsort(scores[top_k])[::-1]]
+        for subject_id, score in zip(
+            self._model.classes_[top_k].tolist(), scores[top_k].tolist()
+        ):
             if subject_id is not None:
-                results.append(
-                    SubjectSuggestion(subject_id=subject_id, score=scores[class_id])
-                )
+                results.append(SubjectSuggestion(subject_id=subject_id, score=score))
         return results
 
     def _suggest_batch(
@@ -8,11 +8,12 @@ import tempfile
 from typing import TYPE_CHECKING, Any
 
 import gensim.similarities
+import numpy as np
 from gensim.matutils import Sparse2Corpus
 
 import annif.util
 from annif.exception import NotInitializedException, NotSupportedException
-from annif.suggestion import vector_to_suggestions
+from annif.suggestion import SuggestionBatch
 
 from . import backend, mixins
 
@@ -42,8 +43,7 @@ class SubjectBuffer:
             mode = "w"
 
         with open(self._path, mode, encoding="utf-8") as subjfile:
-            for text in self._buffer:
-                print(text, file=subjfile)
+            subjfile.write("".join(text + "\n" for text in self._buffer))
 
         self._buffer = []
         self._created = True
@@ -129,10 +129,16 @@ class TFIDFBackend(mixins.TfidfVectorizerMixin, backend.AnnifBackend):
         veccorpus = self.create_vectorizer(subjects)
         self._create_index(veccorpus)
 
-    def _suggest(self, text: str, params: dict[str, Any]) -> Iterator:
-        self.debug(
-            'Suggesting subjects for text "{}..." (len={})'.format(text[:20], len(text))
+    def _suggest_batch(
+        self, texts: list[str], params: dict[str, Any]
+    ) -> SuggestionBatch:
+        self.debug("Suggesting subjects for batch of {} texts".format(len(texts)))
+        vectors = self.vectorizer.transform(
+            [" ".join(self.project.analyzer.tokenize_words(text)) for text in texts]
+        )
+        # query the similarity index with the whole batch at once; a single
+        # query vector gives a 1-D result, so make sure it is always 2-D
+        similarities = np.atleast_2d(self._index[vectors])
+        return SuggestionBatch.from_dense(
+            similarities, self.project.subjects, limit=int(params["limit"])
         )
-        tokens = self.project.analyzer.tokenize_words(text)
-        vectors = self.vectorizer.transform([" ".join(tokens)])
-        return vector_to_suggestions(self._index[vectors[0]], int(params["limit"]))
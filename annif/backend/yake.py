@@ -33,6 +33,8 @@ class YakeBackend(backend.AnnifBackend):
     # defaults for uninitialized instances
     _index = None
     _graph = None
+    _kw_extractor = None
+    _kw_extractor_params = None
     INDEX_FILE = "yake-index"
 
     DEFAULT_PARAMETERS = {
@@ -112,20 +114,28 @@ class YakeBackend(backend.AnnifBackend):
         words = phrase.split()
         return " ".join(sorted(words))
 
+    def _get_kw_extractor(self, params: dict[str, Any]) -> yake.KeywordExtractor:
+        """Return a keyword extractor for the given parameters, reusing the
+        previous one (and its loaded stopword list) if they are unchanged."""
+        kw_params = {
+            "lan": params["language"],
+            "n": int(params["max_ngram_size"]),
+            "dedupLim": float(params["deduplication_threshold"]),
+            "dedupFunc": params["deduplication_algo"],
+            "windowsSize": int(params["window_size"]),
+            "top": int(params["num_keywords"]),
+            "features": self.params["features"],
+        }
+        if kw_params != self._kw_extractor_params:
+            self._kw_extractor = yake.KeywordExtractor(**kw_params)
+            self._kw_extractor_params = kw_params
+        return self._kw_extractor
+
     def _suggest(self, text: str, params: dict[str, Any]) -> list[SubjectSuggestion]:
         self.debug(f'Suggesting subjects for text "{text[:20]}..." (len={len(text)})')
         limit = int(params["limit"])
 
-        self._kw_extractor = yake.KeywordExtractor(
-            lan=params["language"],
-            n=int(params["max_ngram_size"]),
-            dedupLim=float(params["deduplication_threshold"]),
-            dedupFunc=params["deduplication_algo"],
-            windowsSize=int(params["window_size"]),
-            top=int(params["num_keywords"]),
-            features=self.params["features"],
-        )
-        keyphrases = self._kw_extractor.extract_keywords(text)
+        keyphrases = self._get_kw_extractor(params).extract_keywords(text)
         suggestions = self._keyphrases2suggestions(keyphrases)
 
         subject_suggestions = [
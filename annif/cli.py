@@ -5,7 +5,6 @@ import collections
 import importlib
 import json
 import os.path
-import re
 import sys
 
 import click
@@ -303,10 +302,21 @@ def run_suggest(
 @click.option("--limit", "-l", default=10, help="Maximum number of subjects")
 @click.option("--threshold", "-t", default=0.0, help="Minimum score threshold")
 @click.option("--language", "-L", help="Language of subject labels")
+@click.option(
+    "--jobs", "-j", default=1, help="Number of parallel jobs (0 means all CPUs)"
+)
 @cli_util.backend_param_option
 @cli_util.common_options
 def run_index(
-    project_id, directory, suffix, force, limit, threshold, language, backend_param
+    project_id,
+    directory,
+    suffix,
+    force,
+    limit,
+    threshold,
+    language,
+    jobs,
+    backend_param,
 ):
     """
     Index a directory with documents, suggesting subjects for each document.
@@ -320,17 +330,32 @@ def run_index(
     backend_params = cli_util.parse_backend_params(backend_param, project)
 
     documents = annif.corpus.DocumentDirectory(directory, require_subjects=False)
-    results = project.suggest_corpus(documents, backend_params).filter(limit, threshold)
+    jobs, pool_class = annif.parallel.get_pool(jobs)
 
-    for (docfilename, _), suggestions in zip(documents, results):
-        subjectfilename = re.sub(r"\.txt$", suffix, docfilename)
-        if os.path.exists(subjectfilename) and not force:
-            click.echo(
-                "Not overwriting {} (use --force to override)".format(subjectfilename)
-            )
-            continue
-        with open(subjectfilename, "w", encoding="utf-8") as subjfile:
-            cli_util.show_hits(suggestions, project, lang, file=subjfile)
+    project.initialize(parallel=True)
+    psmap = annif.parallel.ProjectSuggestMap(
+        project.registry, [project_id], backend_params, limit, threshold
+    )
+
+    from annif.suggestion import SuggestionResults
+
+    with pool_class(jobs) as pool:
+        results = SuggestionResults(
+            hit_sets[project_id]
+            for hit_sets, _ in pool.imap(psmap.suggest_batch, documents.doc_batches)
+        )
+
+        for (docfilename, _), suggestions in zip(documents, results):
+            subjectfilename = docfilename[: -len(".txt")] + suffix
+            if os.path.exists(subjectfilename) and not force:
+                click.echo(
+                    "Not overwriting {} (use --force to override)".format(
+                        subjectfilename
+                    )
+                )
+                continue
+            with open(subjectfilename, "w", encoding="utf-8") as subjfile:
+                cli_util.show_hits(suggestions, project, lang, file=subjfile)
 
 
 @cli.command("eval")
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import glob
 import gzip
 import os.path
-import re
 from itertools import islice
 from typing import TYPE_CHECKING
 
@@ -42,16 +40,20 @@ class DocumentDirectory(DocumentCorpus):
         subjectfile) containing file paths. If require_subjects is False, the
         subjectfile will be returned as None."""
 
-        for filename in sorted(glob.glob(os.path.join(self.path, "*.txt"))):
+        # scan the directory once instead of checking each subject file
+        with os.scandir(self.path) as entries:
+            filenames = {entry.name for entry in entries if not entry.is_dir()}
+
+        for docname in sorted(filenames):
+            if not docname.endswith(".txt") or docname.startswith("."):
+                continue
+            filename = os.path.join(self.path, docname)
             if self.require_subjects:
-                tsvfilename = re.sub(r"\.txt$", ".tsv", filename)
-                if os.path.exists(tsvfilename):
-                    yield (filename, tsvfilename)
-                    continue
-                keyfilename = re.sub(r"\.txt$", ".key", filename)
-                if os.path.exists(keyfilename):
-                    yield (filename, keyfilename)
-                    continue
+                for suffix in (".tsv", ".key"):
+                    subjname = docname[:-4] + suffix
+                    if subjname in filenames:
+                        yield (filename, os.path.join(self.path, subjname))
+                        break
             else:
                 yield (filename, None)
 
@@ -88,12 +90,12 @@ class DocumentFile(DocumentCorpus):
                 yield from self._parse_tsv_line(line)
 
     def _parse_tsv_line(self, line: str) -> Iterator[Document]:
-        if "\t" in line:
-            text, uris = line.split("\t", maxsplit=1)
-            subject_ids = {
-                self.subject_index.by_uri(annif.util.cleanup_uri(uri))
-                for uri in uris.split()
-            }
+        text, sep, uris = line.partition("\t")
+        if sep:
+            # SubjectSet removes duplicate subject IDs, no need for a set here
+            subject_ids = map(
+                self.subject_index.by_uri, map(annif.util.cleanup_uri, uris.split())
+            )
             yield Document(text=text, subject_set=SubjectSet(subject_ids))
         else:
             logger.warning('Skipping invalid line (missing tab): "%s"', line.rstrip())
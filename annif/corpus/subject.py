@@ -62,12 +62,14 @@ class SubjectFileCSV(SubjectCorpus):
         """initialize the SubjectFileCSV given a path to a CSV file"""
         self.path = path
 
-    def _parse_row(self, row: dict[str, str]) -> Iterator[Subject]:
-        labels = {
-            fname.replace("label_", ""): value or None
-            for fname, value in row.items()
-            if fname.startswith("label_")
-        }
+    def _parse_row(
+        self,
+        row: list[str],
+        uri_col: int,
+        notation_col: int | None,
+        label_cols: dict[str, int],
+    ) -> Iterator[Subject]:
+        labels = {lang: row[col] or None for lang, col in label_cols.items()}
 
         # if there are no labels in any language, set labels to None
         # indicating a deprecated subject
@@ -75,9 +77,9 @@ class SubjectFileCSV(SubjectCorpus):
             labels = None
 
         yield Subject(
-            uri=annif.util.cleanup_uri(row["uri"]),
+            uri=annif.util.cleanup_uri(row[uri_col]),
             labels=labels,
-            notation=row.get("notation", None) or None,
+            notation=(row[notation_col] or None) if notation_col is not None else None,
         )
 
     @property
@@ -96,9 +98,30 @@ class SubjectFileCSV(SubjectCorpus):
     @property
     def subjects(self) -> Generator:
         with open(self.path, encoding="utf-8-sig") as csvfile:
-            reader = csv.DictReader(csvfile)
+            # use a plain reader and resolve the column positions once,
+            # instead of building a dict for every row with DictReader
+            reader = csv.reader(csvfile)
+            fieldnames = next(reader, None)
+            if fieldnames is None:
+                return
+            uri_col = fieldnames.index("uri") if "uri" in fieldnames else None
+            notation_col = (
+                fieldnames.index("notation") if "notation" in fieldnames else None
+            )
+            label_cols = {
+                fname.replace("label_", ""): col
+                for col, fname in enumerate(fieldnames)
+                if fname.startswith("label_")
+            }
+            padding = [""] * len(fieldnames)
             for row in reader:
-                yield from self._parse_row(row)
+                if not row:
+                    continue  # skip empty lines like DictReader does
+                if uri_col is None:
+                    raise ValueError(f'subject file "{self.path}" has no "uri" column')
+                if len(row) < len(fieldnames):
+                    row += padding[len(row) :]
+                yield from self._parse_row(row, uri_col, notation_col, label_cols)
 
     def save_skos(self, path: str) -> None:
         """Save the contents of the subject vocabulary into a SKOS/Turtle
@@ -121,6 +144,7 @@ class SubjectIndex:
         self._uri_idx = {}
         self._label_idx = {}
         self._languages = None
+        self._deprecated_ids = None
 
     def load_subjects(self, corpus: SubjectCorpus) -> None:
         """Initialize the subject index from a subject corpus"""
@@ -149,6 +173,7 @@ class SubjectIndex:
             for lang, label in subject.labels.items():
                 self._label_idx[(label, lang)] = subject_id
         self._subjects.append(subject)
+        self._deprecated_ids = None  # invalidate cached value
 
     def contains_uri(self, uri: str) -> bool:
         return uri in self._uri_idx
@@ -156,30 +181,30 @@ class SubjectIndex:
     def by_uri(self, uri: str, warnings: bool = True) -> int | None:
         """return the subject ID of a subject by its URI, or None if not found.
         If warnings=True, log a warning message if the URI cannot be found."""
-        try:
-            return self._uri_idx[uri]
-        except KeyError:
-            if warnings:
-                logger.warning("Unknown subject URI <%s>", uri)
-            return None
+        subject_id = self._uri_idx.get(uri)
+        if subject_id is None and warnings:
+            logger.warning("Unknown subject URI <%s>", uri)
+        return subject_id
 
     def by_label(self, label: str | None, language: str) -> int | None:
         """return the subject ID of a subject by its label in a given
         language"""
-        try:
-            return self._label_idx[(label, language)]
-        except KeyError:
+        subject_id = self._label_idx.get((label, language))
+        if subject_id is None:
             logger.warning('Unknown subject label "%s"@%s', label, language)
-            return None
+        return subject_id
 
     def deprecated_ids(self) -> list[int]:
         """return indices of deprecated subjects"""
 
-        return [
-            subject_id
-            for subject_id, subject in enumerate(self._subjects)
-            if subject.labels is None
-        ]
+        # this is needed for every suggestion batch, so compute it only once
+        if self._deprecated_ids is None:
+            self._deprecated_ids = [
+                subject_id
+                for subject_id, subject in enumerate(self._subjects)
+                if subject.labels is None
+            ]
+        return list(self._deprecated_ids)
 
     @property
     def active(self) -> list[tuple[int, Subject]]:
@@ -98,14 +98,18 @@ class EvaluationBatch:
             )
         self._suggestion_arrays.append(suggestion_batch.array)
 
-        # convert gold_subject_batch to sparse matrix
-        ar = scipy.sparse.dok_array(
-            (len(gold_subject_batch), len(self._subject_index)), dtype=bool
-        )
+        # convert gold_subject_batch to sparse matrix, collecting the
+        # coordinates first instead of inserting elements one by one
+        rows, cols = [], []
         for idx, subject_set in enumerate(gold_subject_batch):
             for subject_id in subject_set:
-                ar[idx, subject_id] = True
-        self._gold_subject_arrays.append(ar.tocsr())
+                rows.append(idx)
+                cols.append(subject_id)
+        ar = scipy.sparse.csr_array(
+            (np.ones(len(rows), dtype=bool), (rows, cols)),
+            shape=(len(gold_subject_batch), len(self._subject_index)),
+        )
+        self._gold_subject_arrays.append(ar)
 
     def _evaluate_samples(
         self,
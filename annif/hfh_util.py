@@ -120,7 +120,7 @@ def _is_train_file(fname: str) -> bool:
 def _archive_dir(data_dir: str) -> io.BufferedRandom:
     fp = tempfile.TemporaryFile()
     path = pathlib.Path(data_dir)
-    fpaths = [fpath for fpath in path.glob("**/*") if not _is_train_file(fpath.name)]
+    fpaths = (fpath for fpath in path.glob("**/*") if not _is_train_file(fpath.name))
     with zipfile.ZipFile(fp, mode="w") as zfile:
         zfile.comment = bytes(
             f"Archived by Annif {importlib.metadata.version('annif')}",
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
 
     from rdflib.graph import Graph
     from rdflib.term import URIRef
+    from scipy.sparse import csc_matrix
 
     from annif.analyzer import Analyzer
     from annif.corpus.document import DocumentCorpus
@@ -111,12 +112,6 @@ def candidates_to_features(
 
     matrix = np.zeros((len(candidates), len(Feature)), dtype=np.float32)
     c_ids = [c.subject_id for c in candidates]
-    c_vec = np.zeros(mdata.related.shape[0], dtype=bool)
-    c_vec[c_ids] = True
-    broader = mdata.broader.multiply(c_vec).sum(axis=1)
-    narrower = mdata.narrower.multiply(c_vec).sum(axis=1)
-    related = mdata.related.multiply(c_vec).sum(axis=1)
-    collection = mdata.collection.multiply(c_vec).T.dot(mdata.collection).sum(axis=0)
     for idx, c in enumerate(candidates):
         subj = c.subject_id
         matrix[idx, Feature.freq] = c.freq
@@ -130,10 +125,20 @@ def candidates_to_features(
         matrix[idx, Feature.last_occ] = c.last_occ
         matrix[idx, Feature.spread] = c.spread
         matrix[idx, Feature.doc_length] = c.doc_length
-        matrix[idx, Feature.broader] = broader[subj, 0] / len(c_ids)
-        matrix[idx, Feature.narrower] = narrower[subj, 0] / len(c_ids)
-        matrix[idx, Feature.related] = related[subj, 0] / len(c_ids)
-        matrix[idx, Feature.collection] = collection[0, subj] / len(c_ids)
+
+    # The relation features only involve relations among the candidates, so
+    # slice the candidate rows/columns out of the vocabulary-sized matrices
+    # instead of computing over the whole vocabulary for every document.
+    def candidate_relations(relmatrix: csc_matrix) -> np.ndarray:
+        return np.asarray(relmatrix.sum(axis=1)).ravel() / len(c_ids)
+
+    matrix[:, Feature.broader] = candidate_relations(mdata.broader[c_ids][:, c_ids])
+    matrix[:, Feature.narrower] = candidate_relations(mdata.narrower[c_ids][:, c_ids])
+    matrix[:, Feature.related] = candidate_relations(mdata.related[c_ids][:, c_ids])
+    c_collections = mdata.collection[:, c_ids]
+    matrix[:, Feature.collection] = candidate_relations(
+        c_collections.T.dot(c_collections)
+    )
     return matrix
 
 
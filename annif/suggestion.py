@@ -25,31 +25,43 @@ def vector_to_suggestions(vector: np.ndarray, limit: int) -> Iterator:
     )
 
 
+def suggestion_ranks(preds: csr_array) -> np.ndarray:
+    """rank the stored scores of a 2D sparse suggestion array (csr_array)
+    within each row, 0 being the highest; the ranks are aligned with
+    preds.data"""
+
+    rows = np.repeat(np.arange(preds.shape[0]), np.diff(preds.indptr))
+    order = np.lexsort((-preds.data, rows))
+    ranks = np.empty(len(order), dtype=np.intp)
+    ranks[order] = np.arange(len(order)) - preds.indptr[rows[order]]
+    return ranks
+
+
 def filter_suggestion(
     preds: csr_array,
     limit: int | None = None,
     threshold: float = 0.0,
+    ranks: np.ndarray | None = None,
 ) -> csr_array:
     """filter a 2D sparse suggestion array (csr_array), retaining only the
     top K suggestions with a score above or equal to the threshold for each
-    individual prediction; the rest will be left as zeros"""
+    individual prediction; the rest will be left as zeros. Precomputed ranks
+    (see suggestion_ranks) can be given to avoid sorting the scores again."""
 
     if limit == 0:
         return csr_array(preds.shape, dtype=np.float32)  # empty
 
-    data, rows, cols = [], [], []
-    for row in range(preds.shape[0]):
-        arow = preds[[row]]
-        if limit is not None and limit < len(arow.data):
-            topk_idx = arow.data.argpartition(-limit)[-limit:]
-        else:
-            topk_idx = range(len(arow.data))
-        for idx in topk_idx:
-            if arow.data[idx] >= threshold:
-                data.append(arow.data[idx])
-                rows.append(row)
-                cols.append(arow.indices[idx])
-    return csr_array((data, (rows, cols)), shape=preds.shape, dtype=np.float32)
+    rows = np.repeat(np.arange(preds.shape[0]), np.diff(preds.indptr))
+    mask = preds.data >= threshold
+    if limit is not None:
+        if ranks is None:
+            ranks = suggestion_ranks(preds)
+        mask &= ranks < limit
+    return csr_array(
+        (preds.data[mask], (rows[mask], preds.indices[mask])),
+        shape=preds.shape,
+        dtype=np.float32,
+    )
 
 
 class SuggestionResult:
@@ -59,21 +71,33 @@ class SuggestionResult:
         self._array = array
         self._idx = idx
 
+    def _nonzero(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the subject IDs and scores of the nonzero entries in this
+        row, read directly from the CSR index arrays."""
+        start, end = self._array.indptr[self._idx : self._idx + 2]
+        cols = self._array.indices[start:end]
+        scores = self._array.data[start:end]
+        mask = scores != 0
+        return cols[mask], scores[mask]
+
     def __iter__(self):
-        _, cols = self._array[[self._idx], :].nonzero()
-        suggestions = [
-            SubjectSuggestion(subject_id=col, score=float(self._array[self._idx, col]))
-            for col in cols
-        ]
+        cols, scores = self._nonzero()
+        order = np.argsort(-scores, kind="stable")
         return iter(
-            sorted(suggestions, key=lambda suggestion: suggestion.score, reverse=True)
+            [
+                SubjectSuggestion(subject_id=col, score=score)
+                for col, score in zip(cols[order].tolist(), scores[order].tolist())
+            ]
         )
 
     def as_vector(self) -> np.ndarray:
-        return self._array[[self._idx], :].toarray()[0]
+        cols, scores = self._nonzero()
+        vector = np.zeros(self._array.shape[1], dtype=self._array.dtype)
+        vector[cols] = scores
+        return vector
 
     def __len__(self) -> int:
-        _, cols = self._array[[self._idx], :].nonzero()
+        cols, _ = self._nonzero()
         return len(cols)
 
 
@@ -84,6 +108,7 @@ class SuggestionBatch:
         """Create a new SuggestionBatch from a csr_array"""
         assert isinstance(array, csr_array)
         self.array = array
+        self._ranks = None
 
     @classmethod
     def from_sequence(
@@ -112,6 +137,37 @@ class SuggestionBatch:
             )
         )
 
+    @classmethod
+    def from_dense(
+        cls,
+        scores: np.ndarray,
+        subject_index: SubjectIndex,
+        limit: int,
+    ) -> SuggestionBatch:
+        """Create a new SuggestionBatch from a 2D array of subject scores with
+        one row per document, retaining the top K scores of each row."""
+
+        n_docs, n_cols = scores.shape
+        limit = min(limit, n_cols)
+        if limit <= 0:
+            return cls(csr_array((n_docs, len(subject_index)), dtype=np.float32))
+
+        # select the top K columns of every row at once
+        cols = np.argpartition(scores, -limit, axis=1)[:, -limit:]
+        data = np.take_along_axis(scores, cols, axis=1)
+        rows = np.broadcast_to(np.arange(n_docs)[:, np.newaxis], cols.shape)
+        mask = data > 0.0
+        deprecated = subject_index.deprecated_ids()
+        if deprecated:
+            mask &= ~np.isin(cols, deprecated)
+        return cls(
+            csr_array(
+                (np.minimum(data[mask], 1.0), (rows[mask], cols[mask])),
+                shape=(n_docs, len(subject_index)),
+                dtype=np.float32,
+            )
+        )
+
     @classmethod
     def from_averaged(
         cls, batches: list[SuggestionBatch], weights: list[float]
@@ -119,9 +175,11 @@ class SuggestionBatch:
         """Create a new SuggestionBatch where the subject scores are the
         weighted average of scores in several SuggestionBatches"""
 
+        # normalize the weights up front to avoid a separate division pass
+        total = sum(weights)
         avg_array = sum(
-            [batch.array * weight for batch, weight in zip(batches, weights)]
-        ) / sum(weights)
+            batch.array * (weight / total) for batch, weight in zip(batches, weights)
+        )
         return SuggestionBatch(avg_array)
 
     def filter(
@@ -130,7 +188,13 @@ class SuggestionBatch:
         """Return a subset of the hits, filtered by the given limit and
         score threshold, as another SuggestionBatch object."""
 
-        return SuggestionBatch(filter_suggestion(self.array, limit, threshold))
+        if limit is not None and self._ranks is None:
+            # rank once, so that repeated filtering of the same batch with
+            # different limits does not need to sort the scores again
+            self._ranks = suggestion_ranks(self.array)
+        return SuggestionBatch(
+            filter_suggestion(self.array, limit, threshold, self._ranks)
+        )
 
     def __getitem__(self, idx: int) -> SuggestionResult:
         if idx < 0 or idx >= len(self):
@@ -51,8 +51,9 @@ class AnnifVocabulary(DatadirMixin):
         updated_subjects = annif.corpus.SubjectIndex()
 
         for old_subject in old_subjects:
-            if new_subjects.contains_uri(old_subject.uri):
-                new_subject = new_subjects[new_subjects.by_uri(old_subject.uri)]
+            new_subject_id = new_subjects.by_uri(old_subject.uri, warnings=False)
+            if new_subject_id is not None:
+                new_subject = new_subjects[new_subject_id]
             else:  # subject removed from new corpus
                 new_subject = annif.corpus.Subject(
                     uri=old_subject.uri, labels=None, notation=None
@@ -1,6 +1,7 @@
 """Unit tests for backends in Annif"""
 
 import importlib.util
+import unittest.mock
 
 import pytest
 
@@ -24,6 +25,23 @@ def test_get_backend_dummy(project, dummy_subject_index):
     assert hits[0].score == 1.0
 
 
+def test_suggest_zero_limit(project):
+    dummy_type = annif.backend.get_backend("dummy")
+    dummy = dummy_type(backend_id="dummy", config_params={"limit": 0}, project=project)
+    with unittest.mock.patch.object(dummy, "_suggest") as mock_suggest:
+        results = dummy.suggest(["this is some text", "more text"])
+    mock_suggest.assert_not_called()
+    assert len(results) == 2
+    assert all(len(result) == 0 for result in results)
+
+
+def test_get_backend_cached():
+    annif.backend.get_backend("dummy")
+    hits = annif.backend.get_backend.cache_info().hits
+    annif.backend.get_backend("dummy")
+    assert annif.backend.get_backend.cache_info().hits == hits + 1
+
+
 def test_learn_dummy(project, tmpdir):
     dummy_type = annif.backend.get_backend("dummy")
     dummy = dummy_type(backend_id="dummy", config_params={}, project=project)
@@ -103,3 +121,26 @@ def test_get_backend_stwfsa_not_installed():
     with pytest.raises(ValueError) as excinfo:
         annif.backend.get_backend("stwfsa")
     assert "STWFSA not available" in str(excinfo.value)
+
+
+def test_model_file_paths(tmpdir):
+    project = unittest.mock.Mock(datadir=str(tmpdir))
+    tfidf_type = annif.backend.get_backend("tfidf")
+    tfidf = tfidf_type(backend_id="tfidf", config_params={}, project=project)
+    assert not tfidf.is_trained
+    assert tfidf.modification_time is None
+
+    tmpdir.join("tfidf-train.txt").write("training data")
+    tmpdir.join("tmp-foo").write("temporary file")
+    tmpdir.join("vectorizer").write("vectorizer")
+    tmpdir.join(".hidden").write("hidden file")
+    assert not tfidf.is_trained
+
+    tmpdir.join("nn-train.mdb").ensure("data.mdb")
+    tmpdir.join("tfidf-index").write("index")
+    assert tfidf.is_trained
+    assert sorted(tfidf._model_file_paths) == [
+        str(tmpdir.join("nn-train.mdb", "data.mdb")),
+        str(tmpdir.join("tfidf-index")),
+    ]
+    assert tfidf.modification_time is not None
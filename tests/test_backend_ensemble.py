@@ -1,5 +1,8 @@
 """Unit tests for the ensemble backend in Annif"""
 
+import multiprocessing.dummy
+import unittest.mock
+
 import pytest
 
 import annif.backend
@@ -14,3 +17,34 @@ def test_ensemble_train(project, document_corpus):
 
     with pytest.raises(NotSupportedException):
         ensemble.train(document_corpus)
+
+
+def test_ensemble_default_params(project):
+    ensemble_type = annif.backend.get_backend("ensemble")
+    ensemble = ensemble_type(
+        backend_id="ensemble", config_params={"sources": "dummy"}, project=project
+    )
+    assert ensemble.params["parallel_sources"] is False
+
+
+def test_ensemble_suggest_parallel_sources(app_project):
+    ensemble_type = annif.backend.get_backend("ensemble")
+    results = {}
+    for parallel_sources in ("false", "true"):
+        ensemble = ensemble_type(
+            backend_id="ensemble",
+            config_params={
+                "sources": "dummy-en,dummy-fi",
+                "parallel_sources": parallel_sources,
+            },
+            project=app_project,
+        )
+        with unittest.mock.patch(
+            "multiprocessing.dummy.Pool", wraps=multiprocessing.dummy.Pool
+        ) as mock_pool:
+            batch = ensemble.suggest(["this is some text"])
+        assert mock_pool.called == (parallel_sources == "true")
+        results[parallel_sources] = batch.array.toarray()
+
+    assert (results["false"] == results["true"]).all()
+    assert results["true"].any()
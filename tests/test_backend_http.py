@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 import pytest
 import requests.exceptions
+from requests.adapters import HTTPAdapter
 
 import annif.backend.http
 from annif.corpus import Subject
@@ -13,7 +14,7 @@ from annif.exception import OperationFailedException
 
 
 def test_http_suggest(app_project):
-    with unittest.mock.patch("requests.post") as mock_request:
+    with unittest.mock.patch("requests.Session.post") as mock_request:
         # create a mock response whose .json() method returns the list that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -42,7 +43,7 @@ def test_http_suggest(app_project):
 
 
 def test_http_suggest_with_results(app_project):
-    with unittest.mock.patch("requests.post") as mock_request:
+    with unittest.mock.patch("requests.Session.post") as mock_request:
         # create a mock response whose .json() method returns the list that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -85,7 +86,7 @@ def test_http_suggest_with_results(app_project):
 
 
 def test_http_suggest_post_args(app_project):
-    with unittest.mock.patch("requests.post"):
+    with unittest.mock.patch("requests.Session.post"):
         http_type = annif.backend.get_backend("http")
         http = http_type(
             backend_id="http",
@@ -98,17 +99,22 @@ def test_http_suggest_post_args(app_project):
         )
         http.suggest(["this is some text"])
 
-        assert requests.post.call_args.args == ("http://api.example.org/analyze",)
-        assert "text" in requests.post.call_args.kwargs["data"]
-        assert requests.post.call_args.kwargs["data"]["text"] == "this is some text"
-        assert "project" in requests.post.call_args.kwargs["data"]
-        assert requests.post.call_args.kwargs["data"]["project"] == "dummy"
-        assert "limit" in requests.post.call_args.kwargs["data"]
-        assert requests.post.call_args.kwargs["data"]["limit"] == "42"
+        assert requests.Session.post.call_args.args == (
+            "http://api.example.org/analyze",
+        )
+        assert "text" in requests.Session.post.call_args.kwargs["data"]
+        assert (
+            requests.Session.post.call_args.kwargs["data"]["text"]
+            == "this is some text"
+        )
+        assert "project" in requests.Session.post.call_args.kwargs["data"]
+        assert requests.Session.post.call_args.kwargs["data"]["project"] == "dummy"
+        assert "limit" in requests.Session.post.call_args.kwargs["data"]
+        assert requests.Session.post.call_args.kwargs["data"]["limit"] == "42"
 
 
 def test_http_suggest_zero_score(project):
-    with unittest.mock.patch("requests.post") as mock_request:
+    with unittest.mock.patch("requests.Session.post") as mock_request:
         # create a mock response whose .json() method returns the list that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -131,7 +137,7 @@ def test_http_suggest_zero_score(project):
 
 
 def test_http_suggest_error(project):
-    with unittest.mock.patch("requests.post") as mock_request:
+    with unittest.mock.patch("requests.Session.post") as mock_request:
         mock_request.side_effect = requests.exceptions.RequestException("failed")
 
         http_type = annif.backend.get_backend("http")
@@ -148,7 +154,7 @@ def test_http_suggest_error(project):
 
 
 def test_http_suggest_json_fails(project):
-    with unittest.mock.patch("requests.post") as mock_request:
+    with unittest.mock.patch("requests.Session.post") as mock_request:
         # create a mock response whose .json() method returns the list that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -169,7 +175,7 @@ def test_http_suggest_json_fails(project):
 
 
 def test_http_suggest_unexpected_json(project):
-    with unittest.mock.patch("requests.post") as mock_request:
+    with unittest.mock.patch("requests.Session.post") as mock_request:
         # create a mock response whose .json() method returns the list that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -190,7 +196,7 @@ def test_http_suggest_unexpected_json(project):
 
 
 def test_http_is_trained(project):
-    with unittest.mock.patch("requests.get") as mock_request:
+    with unittest.mock.patch("requests.Session.get") as mock_request:
         # create a mock response whose .json() method returns the dict that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -210,7 +216,7 @@ def test_http_is_trained(project):
 
 
 def test_http_modification_time(project):
-    with unittest.mock.patch("requests.get") as mock_request:
+    with unittest.mock.patch("requests.Session.get") as mock_request:
         # create a mock response whose .json() method returns the dict that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -234,7 +240,7 @@ def test_http_modification_time(project):
 
 
 def test_http_modification_time_none(project):
-    with unittest.mock.patch("requests.get") as mock_request:
+    with unittest.mock.patch("requests.Session.get") as mock_request:
         # create a mock response whose .json() method returns the dict that we
         # define here
         mock_response = unittest.mock.Mock()
@@ -254,7 +260,7 @@ def test_http_modification_time_none(project):
 
 
 def test_http_get_project_info_http_error(project):
-    with unittest.mock.patch("requests.get") as mock_request:
+    with unittest.mock.patch("requests.Session.get") as mock_request:
         mock_request.side_effect = requests.exceptions.RequestException("failed")
 
         http_type = annif.backend.get_backend("http")
@@ -271,7 +277,7 @@ def test_http_get_project_info_http_error(project):
 
 
 def test_http_get_project_info_json_decode_error(project):
-    with unittest.mock.patch("requests.get") as mock_request:
+    with unittest.mock.patch("requests.Session.get") as mock_request:
         mock_response = unittest.mock.Mock()
         mock_response.json.side_effect = ValueError("JSON decode failed")
         mock_request.return_value = mock_response
@@ -290,7 +296,7 @@ def test_http_get_project_info_json_decode_error(project):
 
 
 def test_headers(project):
-    with unittest.mock.patch("requests.post"):
+    with unittest.mock.patch("requests.Session.post"):
         http_type = annif.backend.get_backend("http")
         http = http_type(
             backend_id="http",
@@ -303,6 +309,189 @@ def test_headers(project):
         http.suggest("this is some text")
 
         version = importlib.metadata.version("annif")
-        assert requests.post.call_args.kwargs["headers"] == {
+        assert requests.Session.post.call_args.kwargs["headers"] == {
             "User-Agent": f"Annif/{version}"
         }
+
+
+def test_http_session(project):
+    http_type = annif.backend.get_backend("http")
+    http = http_type(
+        backend_id="http",
+        config_params={
+            "endpoint": "http://api.example.org/suggest",
+            "project": "dummy",
+        },
+        project=project,
+    )
+    session = http.session
+    assert http.session is session  # reused between requests
+    adapter = session.get_adapter("http://api.example.org/suggest")
+    assert adapter.max_retries.total == 3
+    assert "POST" in adapter.max_retries.allowed_methods
+
+
+def test_http_default_concurrency(project):
+    http_type = annif.backend.get_backend("http")
+    http = http_type(
+        backend_id="http",
+        config_params={"endpoint": "http://api.example.org/suggest"},
+        project=project,
+    )
+    assert http.params["concurrency"] == 1
+
+
+def test_http_suggest_batch_creates_one_session(app_project):
+    with unittest.mock.patch("requests.Session.post") as mock_request:
+        mock_response = unittest.mock.Mock()
+        mock_response.json.return_value = []
+        mock_request.return_value = mock_response
+
+        http_type = annif.backend.get_backend("http")
+        http = http_type(
+            backend_id="http",
+            config_params={
+                "endpoint": "http://api.example.org/analyze",
+                "concurrency": "8",
+            },
+            project=app_project,
+        )
+        with unittest.mock.patch(
+            "requests.Session", wraps=requests.Session
+        ) as mock_session:
+            http.suggest([f"text {idx}" for idx in range(8)])
+        assert mock_session.call_count == 1
+        assert mock_request.call_count == 8
+
+
+def test_http_session_pool_follows_concurrency(app_project):
+    with unittest.mock.patch("requests.Session.post") as mock_request:
+        mock_response = unittest.mock.Mock()
+        mock_response.json.return_value = []
+        mock_request.return_value = mock_response
+
+        http_type = annif.backend.get_backend("http")
+        http = http_type(
+            backend_id="http",
+            config_params={"endpoint": "http://api.example.org/analyze"},
+            project=app_project,
+        )
+        with unittest.mock.patch(
+            "annif.backend.http.HTTPAdapter", wraps=HTTPAdapter
+        ) as mock_adapter:
+            http.suggest(
+                ["first text", "second text", "third text"], {"concurrency": 3}
+            )
+        assert mock_adapter.call_args.kwargs["pool_maxsize"] == 3
+        adapter = http.session.get_adapter("http://api.example.org/analyze")
+        assert adapter.max_retries.total == 3
+
+
+def test_http_suggest_batch(app_project):
+    with unittest.mock.patch("requests.Session.post") as mock_request:
+        mock_response = unittest.mock.Mock()
+        mock_response.json.return_value = [
+            {"uri": "http://example.org/dummy", "label": "dummy", "score": 1.0}
+        ]
+        mock_request.return_value = mock_response
+
+        http_type = annif.backend.get_backend("http")
+        http = http_type(
+            backend_id="http",
+            config_params={
+                "endpoint": "http://api.example.org/analyze",
+                "project": "dummy",
+                "concurrency": "2",
+            },
+            project=app_project,
+        )
+        results = http.suggest(["first text", "second text", "third text"])
+        assert mock_request.call_count == 3
+        texts = {call.kwargs["data"]["text"] for call in mock_request.call_args_list}
+        assert texts == {"first text", "second text", "third text"}
+        assert len(results) == 3
+        dummy_id = app_project.subjects.by_uri("http://example.org/dummy")
+        for result in results:
+            assert [hit.subject_id for hit in result] == [dummy_id]
+
+
+def test_http_suggest_batch_endpoint(app_project):
+    with unittest.mock.patch("requests.Session.post") as mock_request:
+        mock_response = unittest.mock.Mock()
+        mock_response.json.return_value = [
+            {
+                "document_id": None,
+                "results": [
+                    {"uri": "http://example.org/dummy", "label": "dummy", "score": 1.0}
+                ],
+            },
+            {"document_id": None, "results": []},
+        ]
+        mock_request.return_value = mock_response
+
+        http_type = annif.backend.get_backend("http")
+        http = http_type(
+            backend_id="http",
+            config_params={
+                "endpoint": "http://api.example.org/v1/projects/dummy/suggest",
+                "batch_endpoint": "true",
+                "limit": "42",
+            },
+            project=app_project,
+        )
+        results = http.suggest(["first text", "second text"])
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.args == (
+            "http://api.example.org/v1/projects/dummy/suggest-batch",
+        )
+        assert mock_request.call_args.kwargs["json"] == {
+            "documents": [{"text": "first text"}, {"text": "second text"}]
+        }
+        assert mock_request.call_args.kwargs["params"] == {"limit": "42"}
+        assert len(results) == 2
+        assert [hit.subject_id for hit in results[0]] == [
+            app_project.subjects.by_uri("http://example.org/dummy")
+        ]
+        assert len(results[1]) == 0
+
+
+def test_http_suggest_batch_endpoint_http_error(app_project):
+    with unittest.mock.patch("requests.Session.post") as mock_request:
+        mock_request.side_effect = requests.exceptions.RequestException("failed")
+
+        http_type = annif.backend.get_backend("http")
+        http = http_type(
+            backend_id="http",
+            config_params={
+                "endpoint": "http://api.example.org/v1/projects/dummy/suggest",
+                "batch_endpoint": "true",
+            },
+            project=app_project,
+        )
+        results = http.suggest(["first text", "second text"])
+        assert len(results) == 2
+        assert len(results[0]) == 0
+        assert len(results[1]) == 0
+
+
+def test_http_suggest_batch_zero_limit(app_project):
+    http_type = annif.backend.get_backend("http")
+    for config_params in (
+        {"concurrency": "2"},
+        {"batch_endpoint": "true"},
+    ):
+        with unittest.mock.patch("requests.Session.post") as mock_request:
+            http = http_type(
+                backend_id="http",
+                config_params={
+                    "endpoint": "http://api.example.org/v1/projects/dummy/suggest",
+                    "limit": "0",
+                    **config_params,
+                },
+                project=app_project,
+            )
+            results = http.suggest(["first text", "second text"])
+        mock_request.assert_not_called()
+        assert len(results) == 2
+        assert all(len(result) == 0 for result in results)
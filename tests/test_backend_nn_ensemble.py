@@ -2,7 +2,6 @@
 
 import importlib
 import os.path
-import time
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
@@ -118,10 +117,10 @@ def test_nn_ensemble_train_and_learn(registry, tmpdir):
     # test online learning
     modelfile = datadir.join("nn-model.keras")
 
+    # backdate the model file so that a rewrite is sure to change its mtime
+    old_mtime = modelfile.mtime() - 2
+    os.utime(str(modelfile), (old_mtime, old_mtime))
     old_size = modelfile.size()
-    old_mtime = modelfile.mtime()
-
-    time.sleep(0.1)  # make sure the timestamp has a chance to increase
 
     # Learning is typically performed on one document at a time
     document_corpus_single_doc = annif.corpus.LimitingDocumentCorpus(document_corpus, 1)
@@ -1,6 +1,7 @@
 """Unit tests for the PAV backend in Annif"""
 
 import logging
+import unittest.mock
 from datetime import datetime, timedelta, timezone
 
 import py.path
@@ -10,6 +11,13 @@ import annif.backend
 import annif.corpus
 from annif.exception import NotSupportedException
 
+SAMPLE_TEXT_FI = """Arkeologiaa sanotaan joskus myös
+        muinaistutkimukseksi tai muinaistieteeksi. Se on humanistinen tiede
+        tai oikeammin joukko tieteitä, jotka tutkivat ihmisen menneisyyttä.
+        Tutkimusta tehdään analysoimalla muinaisjäännöksiä eli niitä jälkiä,
+        joita ihmisten toiminta on jättänyt maaperään tai vesistöjen
+        pohjaan."""
+
 
 def test_pav_default_params(document_corpus, app_project):
     pav_type = annif.backend.get_backend("pav")
@@ -93,7 +101,11 @@ def test_pav_initialize(app_project):
     pav.initialize()
     assert pav._models is not None
     # initialize a second time - this shouldn't do anything
-    pav.initialize()
+    with unittest.mock.patch(
+        "annif.backend.ensemble.BaseEnsembleBackend.initialize"
+    ) as mock_initialize:
+        pav.initialize()
+    mock_initialize.assert_not_called()
 
 
 def test_pav_suggest(app_project):
@@ -104,16 +116,7 @@ def test_pav_suggest(app_project):
         project=app_project,
     )
 
-    results = pav.suggest(
-        [
-            """Arkeologiaa sanotaan joskus myös
-        muinaistutkimukseksi tai muinaistieteeksi. Se on humanistinen tiede
-        tai oikeammin joukko tieteitä, jotka tutkivat ihmisen menneisyyttä.
-        Tutkimusta tehdään analysoimalla muinaisjäännöksiä eli niitä jälkiä,
-        joita ihmisten toiminta on jättänyt maaperään tai vesistöjen
-        pohjaan."""
-        ]
-    )[0]
+    results = pav.suggest([SAMPLE_TEXT_FI])[0]
 
     assert len(pav._models["dummy-fi"]) == 1
     assert len(results) > 0
@@ -154,16 +157,7 @@ def test_pav_suggest_after_min_docs(app_project):
         project=app_project,
     )
 
-    results = pav.suggest(
-        [
-            """Arkeologiaa sanotaan joskus myös
-        muinaistutkimukseksi tai muinaistieteeksi. Se on humanistinen tiede
-        tai oikeammin joukko tieteitä, jotka tutkivat ihmisen menneisyyttä.
-        Tutkimusta tehdään analysoimalla muinaisjäännöksiä eli niitä jälkiä,
-        joita ihmisten toiminta on jättänyt maaperään tai vesistöjen
-        pohjaan."""
-        ]
-    )[0]
+    results = pav.suggest([SAMPLE_TEXT_FI])[0]
 
     assert len(pav._models["dummy-fi"]) == 0
     assert len(results) > 0
@@ -115,3 +115,16 @@ def test_stwfsa_suggest(project, datadir):
     assert len(results) == 10
     labyrinths = project.subjects.by_uri("http://www.yso.fi/onto/yso/p14174")
     assert labyrinths in [result.subject_id for result in results]
+
+
+def test_stwfsa_suggest_batch(project, datadir):
+    stwfsa_type = get_backend(stwfsa_backend_name)
+    stwfsa = stwfsa_type(
+        backend_id=stwfsa_backend_name, config_params={"limit": 10}, project=project
+    )
+    results = stwfsa.suggest(["1234", "random labyrintit random", "zikkuratit"])
+    assert len(results) == 3
+    assert len(results[0]) == 0
+    labyrinths = project.subjects.by_uri("http://www.yso.fi/onto/yso/p14174")
+    assert labyrinths in [result.subject_id for result in results[1]]
+    assert labyrinths not in [result.subject_id for result in results[2]]
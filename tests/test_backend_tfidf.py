@@ -3,6 +3,14 @@
 import annif
 import annif.backend
 import annif.corpus
+from annif.backend.tfidf import SubjectBuffer
+
+SAMPLE_TEXT_FI = """Arkeologiaa sanotaan joskus myös
+        muinaistutkimukseksi tai muinaistieteeksi. Se on humanistinen tiede
+        tai oikeammin joukko tieteitä, jotka tutkivat ihmisen menneisyyttä.
+        Tutkimusta tehdään analysoimalla muinaisjäännöksiä eli niitä jälkiä,
+        joita ihmisten toiminta on jättänyt maaperään tai vesistöjen
+        pohjaan."""
 
 
 def test_tfidf_default_params(project):
@@ -15,6 +23,16 @@ def test_tfidf_default_params(project):
         assert param in actual_params and actual_params[param] == val
 
 
+def test_subjectbuffer_flush_and_read(tmpdir):
+    buf = SubjectBuffer(str(tmpdir), 42)
+    for idx in range(SubjectBuffer.BUFFER_SIZE + 1):
+        buf.write(f"text {idx}")
+
+    assert tmpdir.join("00000042.txt").exists()
+    expected = [f"text {idx}" for idx in range(SubjectBuffer.BUFFER_SIZE + 1)]
+    assert [line for line in buf.read().splitlines() if line] == expected
+
+
 def test_tfidf_train(datadir, document_corpus, project):
     tfidf_type = annif.backend.get_backend("tfidf")
     tfidf = tfidf_type(backend_id="tfidf", config_params={"limit": 10}, project=project)
@@ -29,16 +47,7 @@ def test_tfidf_suggest(project):
     tfidf_type = annif.backend.get_backend("tfidf")
     tfidf = tfidf_type(backend_id="tfidf", config_params={"limit": 10}, project=project)
 
-    results = tfidf.suggest(
-        [
-            """Arkeologiaa sanotaan joskus myös
-        muinaistutkimukseksi tai muinaistieteeksi. Se on humanistinen tiede
-        tai oikeammin joukko tieteitä, jotka tutkivat ihmisen menneisyyttä.
-        Tutkimusta tehdään analysoimalla muinaisjäännöksiä eli niitä jälkiä,
-        joita ihmisten toiminta on jättänyt maaperään tai vesistöjen
-        pohjaan."""
-        ]
-    )[0]
+    results = tfidf.suggest([SAMPLE_TEXT_FI])[0]
 
     assert len(results) == 10
     archaeology = project.subjects.by_uri("http://www.yso.fi/onto/yso/p1265")
@@ -51,14 +60,7 @@ def test_suggest_params(project):
     params = {"limit": 3}
 
     results = tfidf.suggest(
-        [
-            """Arkeologiaa sanotaan joskus myös
-        muinaistutkimukseksi tai muinaistieteeksi. Se on humanistinen tiede
-        tai oikeammin joukko tieteitä, jotka tutkivat ihmisen menneisyyttä.
-        Tutkimusta tehdään analysoimalla muinaisjäännöksiä eli niitä jälkiä,
-        joita ihmisten toiminta on jättänyt maaperään tai vesistöjen
-        pohjaan."""
-        ],
+        [SAMPLE_TEXT_FI],
         params,
     )[0]
     assert len(results) == 3
@@ -71,3 +73,21 @@ def test_tfidf_suggest_unknown(project):
     results = tfidf.suggest(["abcdefghijk"])[0]  # unknown word
 
     assert len(results) == 0
+
+
+def test_tfidf_suggest_batch(project):
+    tfidf_type = annif.backend.get_backend("tfidf")
+    tfidf = tfidf_type(backend_id="tfidf", config_params={"limit": 10}, project=project)
+
+    results = tfidf.suggest(
+        [
+            """Arkeologiaa sanotaan joskus myös
+        muinaistutkimukseksi tai muinaistieteeksi.""",
+            "abcdefghijk",  # unknown word
+        ]
+    )
+
+    assert len(results) == 2
+    archaeology = project.subjects.by_uri("http://www.yso.fi/onto/yso/p1265")
+    assert archaeology in [result.subject_id for result in results[0]]
+    assert len(results[1]) == 0
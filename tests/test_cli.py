@@ -624,6 +624,24 @@ def test_index(tmpdir):
     )
 
 
+def test_index_two_jobs(tmpdir):
+    tmpdir.join("doc1.txt").write("nothing special")
+    tmpdir.join("doc2.txt").write("nothing special either")
+
+    result = runner.invoke(
+        annif.cli.cli, ["index", "--jobs", "2", "dummy-en", str(tmpdir)]
+    )
+    assert not result.exception
+    assert result.exit_code == 0
+
+    for docname in ("doc1", "doc2"):
+        assert tmpdir.join(f"{docname}.annif").exists()
+        assert (
+            tmpdir.join(f"{docname}.annif").read_text("utf-8")
+            == "<http://example.org/dummy>\tdummy\t1.0000\n"
+        )
+
+
 def test_index_with_language_override(tmpdir):
     tmpdir.join("doc1.txt").write("nothing special")
 
@@ -98,6 +98,16 @@ def test_docdir_key(tmpdir):
     assert files[2][1] is None
 
 
+def test_docdir_skips_hidden_files_and_directories(tmpdir):
+    tmpdir.join("doc1.txt").write("doc1")
+    tmpdir.join(".doc2.txt").write("doc2")
+    tmpdir.mkdir("doc3.txt")
+
+    docdir = annif.corpus.DocumentDirectory(str(tmpdir), require_subjects=False)
+    files = list(docdir)
+    assert files == [(str(tmpdir.join("doc1.txt")), None)]
+
+
 def test_docdir_tsv(tmpdir):
     tmpdir.join("doc1.txt").write("doc1")
     tmpdir.join("doc1.tsv").write("<http://example.org/key1>\tkey1")
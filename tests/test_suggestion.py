@@ -9,6 +9,7 @@ from annif.suggestion import (
     SubjectSuggestion,
     SuggestionBatch,
     filter_suggestion,
+    suggestion_ranks,
     vector_to_suggestions,
 )
 
@@ -76,6 +77,19 @@ def test_filter_suggestion_limit_and_threshold():
     assert filtered.toarray().tolist() == [[0, 0, 3, 0], [0, 4, 3, 0]]
 
 
+def test_suggestion_ranks():
+    pred = csr_array([[0, 1, 3, 2], [1, 4, 3, 0]])
+    ranks = suggestion_ranks(pred)
+    assert ranks.tolist() == [2, 0, 1, 2, 0, 1]
+
+
+def test_filter_suggestion_precomputed_ranks():
+    pred = csr_array([[0, 1, 3, 2], [1, 4, 3, 0]])
+    ranks = suggestion_ranks(pred)
+    filtered = filter_suggestion(pred, limit=2, threshold=3, ranks=ranks)
+    assert filtered.toarray().tolist() == [[0, 0, 3, 0], [0, 4, 3, 0]]
+
+
 def test_suggestionbatch_from_sequence(dummy_subject_index):
     orig_suggestions = [
         [
@@ -128,6 +142,23 @@ def test_suggestionbatch_from_sequence_enforce_score_range(dummy_subject_index):
     assert suggestions[0].score == pytest.approx(1.0)
 
 
+def test_suggestionbatch_from_dense(dummy_subject_index):
+    dummy_id = dummy_subject_index.by_uri("http://example.org/dummy")
+    none_id = dummy_subject_index.by_uri("http://example.org/none")
+    scores = np.zeros((2, len(dummy_subject_index)), dtype=np.float32)
+    scores[0, dummy_id] = 1.2
+    scores[0, none_id] = 0.2
+    scores[1, none_id] = -0.2
+
+    sbatch = SuggestionBatch.from_dense(scores, dummy_subject_index, limit=1)
+    assert len(sbatch) == 2
+    suggestions = list(sbatch[0])
+    assert len(suggestions) == 1
+    assert suggestions[0].subject_id == dummy_id
+    assert suggestions[0].score == pytest.approx(1.0)
+    assert len(sbatch[1]) == 0
+
+
 def test_suggestionbatch_from_sequence_with_deprecated(dummy_subject_index):
     dummy_subject_index.append(
         Subject(uri="http://example.org/deprecated", labels=None, notation=None)
@@ -1,5 +1,7 @@
 """Unit tests for CSV vocabulary functionality in Annif"""
 
+import pytest
+
 from annif.corpus import SubjectFileCSV, SubjectIndex
 
 
@@ -38,6 +40,25 @@ def test_load_csv_uri_brackets(tmpdir):
     assert subjects[1].notation is None
 
 
+def test_load_csv_missing_uri_column(tmpdir):
+    tmpfile = tmpdir.join("subjects.csv")
+    tmpfile.write("label_fi\n" + "hylyt\n")
+
+    corpus = SubjectFileCSV(str(tmpfile))
+    with pytest.raises(ValueError) as excinfo:
+        list(corpus.subjects)
+    assert str(tmpfile) in str(excinfo.value)
+    assert '"uri" column' in str(excinfo.value)
+
+
+def test_load_csv_missing_uri_column_no_rows(tmpdir):
+    tmpfile = tmpdir.join("subjects.csv")
+    tmpfile.write("label_fi\n")
+
+    corpus = SubjectFileCSV(str(tmpfile))
+    assert list(corpus.subjects) == []
+
+
 def test_load_tsv_uri_nobrackets(tmpdir):
     tmpfile = tmpdir.join("subjects.csv")
     tmpfile.write(